@@ -25,11 +25,15 @@ The script stores the images in `<output-dir>/<camera-id>/<timestamp>.jpg`.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
+import hashlib
 import logging
+import math
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone, tzinfo
 from pathlib import Path
@@ -41,16 +45,30 @@ try:  # Python 3.9+
 except ImportError:  # pragma: no cover - fallback for Python <3.9
     ZoneInfo = None  # type: ignore[assignment]
 
-import requests
+import aiofiles
+import httpx
+
+try:  # Optional: C-level JSON parsing for the metadata payload.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 
 LOGGER = logging.getLogger(__name__)
 LTA_TRAFFIC_IMAGES_URL = "https://datamall2.mytransport.sg/ltaodataservice/Traffic-Imagesv2"
 SINGAPORE_TZ = ZoneInfo("Asia/Singapore") if ZoneInfo is not None else None
 SECONDS_PER_DAY = 24 * 60 * 60
+# Default bound on camera images fetched concurrently within a single cycle.
+DEFAULT_DOWNLOAD_CONCURRENCY = 16
+# Chunk size used when streaming image bodies to disk.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Worker threads used for S3 uploads so they overlap with ongoing downloads.
+UPLOAD_MAX_WORKERS = 8
+# WebP quality used when --convert-webp is enabled.
+WEBP_QUALITY = 85
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Camera:
     """Represents the basic information required to poll a camera."""
 
@@ -59,6 +77,59 @@ class Camera:
     longitude: float | None = None
 
 
+def _load_cameras_with_pandas(pandas_module, csv_path: Path) -> List[Camera]:
+    """Load cameras through pandas' C parser for bulk tokenisation."""
+
+    frame = pandas_module.read_csv(csv_path, dtype=str, keep_default_na=False)
+    if "CameraID" not in frame.columns:
+        raise ValueError("CSV file must contain a 'CameraID' column")
+
+    def coordinate_column(name: str) -> List[Optional[float]]:
+        if name not in frame.columns:
+            return [None] * len(frame)
+        column = pandas_module.to_numeric(frame[name], errors="coerce")
+        return [None if pandas_module.isna(value) else float(value) for value in column]
+
+    camera_ids = frame["CameraID"].str.strip()
+    latitudes = coordinate_column("Latitude")
+    longitudes = coordinate_column("Longitude")
+    return [
+        Camera(camera_id=camera_id, latitude=latitude, longitude=longitude)
+        for camera_id, latitude, longitude in zip(camera_ids, latitudes, longitudes)
+        if camera_id
+    ]
+
+
+def _safe_float(value: Optional[str]) -> Optional[float]:
+    """Convert a CSV cell to float, treating blanks and junk as missing."""
+
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _load_cameras_with_csv(csv_path: Path) -> List[Camera]:
+    """Load cameras with the stdlib csv module when pandas is unavailable."""
+
+    with csv_path.open(newline="", encoding="utf-8") as csv_file:
+        reader = csv.DictReader(csv_file)
+        if "CameraID" not in reader.fieldnames:
+            raise ValueError("CSV file must contain a 'CameraID' column")
+
+        return [
+            Camera(
+                camera_id=camera_id,
+                latitude=_safe_float(row.get("Latitude")),
+                longitude=_safe_float(row.get("Longitude")),
+            )
+            for row in reader
+            if (camera_id := row["CameraID"].strip())
+        ]
+
+
 def load_cameras(csv_path: Path) -> List[Camera]:
     """Load camera information from a CSV file.
 
@@ -68,23 +139,15 @@ def load_cameras(csv_path: Path) -> List[Camera]:
         Path to a CSV file with at least a `CameraID` column.
     """
 
-    cameras: List[Camera] = []
-    with csv_path.open(newline="", encoding="utf-8") as csv_file:
-        reader = csv.DictReader(csv_file)
-        if "CameraID" not in reader.fieldnames:
-            raise ValueError("CSV file must contain a 'CameraID' column")
+    try:  # Import lazily; large camera lists parse much faster through pandas.
+        import pandas
+    except ImportError:
+        pandas = None
 
-        for row in reader:
-            camera_id = row["CameraID"].strip()
-            if not camera_id:
-                continue
-            try:
-                latitude = float(row.get("Latitude")) if row.get("Latitude") else None
-                longitude = float(row.get("Longitude")) if row.get("Longitude") else None
-            except ValueError:
-                LOGGER.warning("Invalid coordinates for camera %s; ignoring lat/lon", camera_id)
-                latitude = longitude = None
-            cameras.append(Camera(camera_id=camera_id, latitude=latitude, longitude=longitude))
+    if pandas is not None:
+        cameras = _load_cameras_with_pandas(pandas, csv_path)
+    else:
+        cameras = _load_cameras_with_csv(csv_path)
 
     if not cameras:
         raise ValueError(f"No camera entries found in {csv_path}")
@@ -92,18 +155,83 @@ def load_cameras(csv_path: Path) -> List[Camera]:
     return cameras
 
 
-def fetch_camera_metadata(session: requests.Session, api_key: str) -> Sequence[Dict[str, object]]:
-    """Fetch the current metadata for all LTA cameras."""
+class MetadataCache:
+    """Short-lived cache for the parsed LTA metadata list.
+
+    Holds the last camera list together with its ETag so that
+    :func:`fetch_camera_metadata` can skip the request entirely while the
+    entry is fresh, and revalidate with ``If-None-Match`` once it expires.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self._ttl_seconds = ttl_seconds
+        self.value: Optional[Sequence[Dict[str, object]]] = None
+        self.etag: Optional[str] = None
+        self._fetched_at: Optional[float] = None
+
+    def is_fresh(self) -> bool:
+        return (
+            self.value is not None
+            and self._fetched_at is not None
+            and time.monotonic() - self._fetched_at < self._ttl_seconds
+        )
+
+    def store(self, value: Sequence[Dict[str, object]], etag: Optional[str]) -> None:
+        self.value = value
+        self.etag = etag
+        self._fetched_at = time.monotonic()
+
+    def revalidated(self) -> None:
+        """Reset the TTL after the server confirmed the entry is unchanged."""
+
+        self._fetched_at = time.monotonic()
+
+
+def metadata_request_headers(api_key: str) -> Dict[str, str]:
+    """Build the headers sent with every LTA metadata request.
+
+    The ``AccountKey`` header is sent per request rather than set on the
+    client because the same client also fetches images from the CDN and the
+    API key should not leak to those hosts. Callers should build this dict
+    once and reuse it across calls.
+    """
 
-    headers = {
+    return {
         "AccountKey": api_key,
         "accept": "application/json",
     }
-    response = session.get(LTA_TRAFFIC_IMAGES_URL, headers=headers, timeout=30)
+
+
+async def fetch_camera_metadata(
+    client: httpx.AsyncClient,
+    headers: Dict[str, str],
+    cache: Optional[MetadataCache] = None,
+) -> Sequence[Dict[str, object]]:
+    """Fetch the current metadata for all LTA cameras.
+
+    ``headers`` comes from :func:`metadata_request_headers`. When a ``cache``
+    is supplied, a fresh entry is returned without touching the network and
+    an expired one is revalidated via its ETag so a ``304 Not Modified``
+    avoids re-parsing the body.
+    """
+
+    if cache is not None and cache.is_fresh():
+        return cache.value
+
+    if cache is not None and cache.etag and cache.value is not None:
+        # Copy rather than mutate so the caller's dict stays reusable.
+        headers = {**headers, "If-None-Match": cache.etag}
+
+    response = await client.get(LTA_TRAFFIC_IMAGES_URL, headers=headers)
+    if response.status_code == 304 and cache is not None and cache.value is not None:
+        cache.revalidated()
+        return cache.value
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content) if orjson is not None else response.json()
     if "value" not in data:
         raise RuntimeError("Unexpected response format from LTA API: missing 'value'")
+    if cache is not None:
+        cache.store(data["value"], response.headers.get("ETag"))
     return data["value"]
 
 
@@ -156,17 +284,23 @@ def seconds_until_window(current_seconds: int, start_seconds: int, end_seconds:
     return SECONDS_PER_DAY - current_seconds + start_seconds
 
 
-def download_image(
-    session: requests.Session,
+async def download_image(
+    client: httpx.AsyncClient,
     camera: Camera,
     image_link: str,
     output_dir: Path,
     timestamp: datetime,
-) -> Path:
-    """Download an image for a camera and save it to disk."""
-
-    response = session.get(image_link, timeout=30)
-    response.raise_for_status()
+    semaphore: asyncio.Semaphore,
+    last_digests: Dict[str, bytes],
+    last_modified: Dict[str, str],
+) -> Optional[Path]:
+    """Download an image for a camera and stream it to disk.
+
+    Returns None when the camera's snapshot has not changed since the
+    previous cycle — either because the server answered ``304 Not
+    Modified`` to the conditional GET or because the body hashed identical
+    to the last download — in which case nothing is kept on disk.
+    """
 
     # Use the suffix from the URL if available, otherwise default to .jpg.
     parsed_url = urlparse(image_link)
@@ -175,22 +309,136 @@ def download_image(
     timestamp_str = timestamp.strftime("%Y%m%dT%H%M%SZ")
     safe_name = f"{timestamp_str}_{file_name}"
 
-    # --- 确保输出路径安全 ---
-    destination_dir = output_dir / camera.camera_id
-    _ensure_directory(destination_dir)
-    destination = destination_dir / safe_name
+    # Per-camera directories are created once in poll_and_download, so no
+    # stat/mkdir syscalls are needed on the download path.
+    destination = output_dir / camera.camera_id / safe_name
+    # Stream into a temp file and publish it with an atomic rename, so the
+    # concurrent upload/conversion stages never see a half-written image.
+    part_path = destination.with_name(destination.name + ".part")
+
+    # If a snapshot for the current minute is already on disk — a restart
+    # mid-run or overlapping ticks — skip the network round-trip entirely.
+    minute_prefix = timestamp.strftime("%Y%m%dT%H%M")
+    existing = next(
+        (path for path in destination.parent.glob(f"{minute_prefix}*") if path.suffix != ".part"),
+        None,
+    )
+    if existing is not None:
+        LOGGER.debug("Camera %s already has %s for this minute; skipping fetch", camera.camera_id, existing.name)
+        return None
 
     # --- 保存文件 ---
-    destination.write_bytes(response.content)
+    # Stream the body straight to disk so concurrent downloads never hold
+    # whole images in memory at once.
+    # Ask the CDN to skip the body entirely when the object is unchanged.
+    headers = {}
+    previous_modified = last_modified.get(camera.camera_id)
+    if previous_modified:
+        headers["If-Modified-Since"] = previous_modified
+
+    hasher = hashlib.blake2b(digest_size=16)
+    try:
+        async with semaphore:
+            async with client.stream("GET", image_link, headers=headers) as response:
+                if response.status_code == 304:
+                    return None
+                response.raise_for_status()
+                async with aiofiles.open(part_path, "wb") as image_file:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        hasher.update(chunk)
+                        await image_file.write(chunk)
+                modified = response.headers.get("Last-Modified")
+                if modified:
+                    last_modified[camera.camera_id] = modified
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    # Cameras often serve the same JPEG for consecutive polls; drop exact
+    # repeats so disk and S3 only see fresh snapshots.
+    digest = hasher.digest()
+    if last_digests.get(camera.camera_id) == digest:
+        part_path.unlink()
+        return None
+    last_digests[camera.camera_id] = digest
+    os.replace(part_path, destination)
+    return destination
+
+
+def _convert_to_webp(path: Path) -> Path:
+    """Re-encode a downloaded image as WebP and remove the original.
+
+    Runs in a worker process, so Pillow is imported here rather than at
+    module level.
+    """
+
+    from PIL import Image
+
+    destination = path.with_suffix(".webp")
+    with Image.open(path) as image:
+        image.save(destination, "WEBP", quality=WEBP_QUALITY, method=4)
+    path.unlink()
     return destination
 
 
+async def _download_for_camera(
+    client: httpx.AsyncClient,
+    camera: Camera,
+    image_link: str,
+    output_dir: Path,
+    timestamp: datetime,
+    semaphore: asyncio.Semaphore,
+    last_digests: Dict[str, bytes],
+    last_modified: Dict[str, str],
+    image_executor: Optional[ProcessPoolExecutor],
+    upload_callback: Optional[Callable[[Path, Camera], None]],
+    upload_executor: Optional[ThreadPoolExecutor],
+) -> Optional[str]:
+    """Download one camera image, returning the camera id on success."""
+
+    try:
+        destination = await download_image(
+            client, camera, image_link, output_dir, timestamp, semaphore, last_digests, last_modified
+        )
+    except httpx.HTTPStatusError as exc:
+        LOGGER.warning("Failed to download image for camera %s: %s", camera.camera_id, exc)
+        return None
+    except httpx.HTTPError as exc:
+        LOGGER.warning(
+            "Network error when downloading image for camera %s: %s", camera.camera_id, exc
+        )
+        return None
+
+    if destination is None:
+        LOGGER.debug("Camera %s image unchanged since last cycle; skipped", camera.camera_id)
+        return camera.camera_id
+
+    LOGGER.info("Downloaded camera %s image to %s", camera.camera_id, destination)
+    if image_executor is not None:
+        # Re-encode on spare CPU in a worker process; the event loop keeps
+        # driving other downloads meanwhile.
+        try:
+            destination = await asyncio.get_running_loop().run_in_executor(
+                image_executor, _convert_to_webp, destination
+            )
+        except OSError as exc:
+            LOGGER.warning("Failed to convert %s to WebP: %s", destination, exc)
+    if upload_callback is not None:
+        # Run the blocking boto3 upload in a worker thread so the event loop
+        # keeps driving the remaining downloads while S3 accepts the PUT.
+        await asyncio.get_running_loop().run_in_executor(
+            upload_executor, upload_callback, destination, camera
+        )
+    return camera.camera_id
+
+
 class S3Uploader:
     """Simple helper to push downloaded files to an S3 bucket."""
 
     def __init__(self, bucket: str, prefix: str = "", profile: Optional[str] = None, region: Optional[str] = None):
         try:  # Import lazily so users without boto3 can still run local downloads.
             import boto3
+            from boto3.s3.transfer import TransferConfig
             from botocore.exceptions import BotoCoreError, ClientError
         except ImportError as exc:  # pragma: no cover - depends on optional dependency
             raise RuntimeError("boto3 must be installed to upload to S3") from exc
@@ -205,6 +453,9 @@ class S3Uploader:
         self._client = self._session.client("s3")
         self._bucket = bucket
         self._prefix = prefix.rstrip("/")
+        self._transfer_config = TransferConfig(
+            use_threads=True, max_concurrency=8, multipart_chunksize=8 * 1024 * 1024
+        )
         self._boto_core_error = BotoCoreError
         self._client_error = ClientError
 
@@ -216,13 +467,13 @@ class S3Uploader:
             key = relative_key
 
         try:
-            self._client.upload_file(str(file_path), self._bucket, key)
+            self._client.upload_file(str(file_path), self._bucket, key, Config=self._transfer_config)
             LOGGER.info("Uploaded %s to s3://%s/%s", file_path, self._bucket, key)
         except (self._boto_core_error, self._client_error) as exc:
             LOGGER.error("Failed to upload %s to s3://%s/%s: %s", file_path, self._bucket, key, exc)
 
 
-def poll_and_download(
+async def poll_and_download(
     cameras: Sequence[Camera],
     api_key: str,
     output_dir: Path,
@@ -232,88 +483,149 @@ def poll_and_download(
     active_end_seconds: int,
     active_timezone: tzinfo,
     upload_callback: Optional[Callable[[Path, Camera], None]] = None,
+    convert_webp: bool = False,
+    max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
 ) -> None:
     """Poll the LTA API for the given duration and download camera images."""
 
     camera_lookup = {camera.camera_id: camera for camera in cameras}
-    end_time = datetime.now(timezone.utc) + duration
-
-    with requests.Session() as session:
-        while True:
-            loop_start = datetime.now(timezone.utc)
-            if loop_start >= end_time:
-                LOGGER.info("Reached end of requested duration; stopping fetch loop")
-                break
-
-            local_time = loop_start.astimezone(active_timezone)
-            seconds_since_midnight = (
-                local_time.hour * 60 * 60 + local_time.minute * 60 + local_time.second
-            )
-            if not within_active_window(seconds_since_midnight, active_start_seconds, active_end_seconds):
-                wait_seconds = seconds_until_window(seconds_since_midnight, active_start_seconds, active_end_seconds)
-                if wait_seconds <= 0:
-                    continue
-                remaining = (end_time - loop_start).total_seconds()
-                if remaining <= 0:
-                    LOGGER.info("Reached end of requested duration while waiting for active window")
-                    break
-                sleep_seconds = min(wait_seconds, remaining)
-                LOGGER.debug(
-                    "Current time %s outside active window; sleeping %.0f seconds until next window",
-                    local_time.isoformat(),
-                    sleep_seconds,
-                )
-                time.sleep(max(0, sleep_seconds))
-                continue
+    wanted_cameras = frozenset(camera_lookup)
+    # --- 确保输出路径安全 ---
+    for camera in cameras:
+        _ensure_directory(output_dir / camera.camera_id)
+    # Rolling digest of the last body per camera, used to drop exact repeats.
+    last_digests: Dict[str, bytes] = {}
+    # Last-Modified per camera, replayed as If-Modified-Since on the next GET.
+    last_modified: Dict[str, str] = {}
+    # Singapore observes no DST, so the UTC offset is constant for the whole
+    # run and the window check can use plain integer arithmetic on the hot
+    # path instead of per-tick astimezone conversions.
+    tz_offset_seconds = datetime.now(active_timezone).utcoffset().total_seconds()
+    interval_seconds = interval.total_seconds()
+    end_monotonic = time.monotonic() + duration.total_seconds()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    metadata_cache = MetadataCache(ttl_seconds=min(interval.total_seconds(), 60.0))
+    metadata_headers = metadata_request_headers(api_key)
+    # A single HTTP/2-capable client multiplexes the metadata call and all
+    # image fetches, amortising one TLS handshake per host across the cycle.
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    # Separate connect and read budgets: a dead host fails within ~3s and
+    # frees its slot instead of spending the whole timeout on the handshake.
+    # The transport retries failed connects with backoff before giving up.
+    timeout = httpx.Timeout(30.0, connect=3.05, read=27.0)
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+
+    upload_executor: Optional[ThreadPoolExecutor] = None
+    if upload_callback is not None:
+        upload_executor = ThreadPoolExecutor(
+            max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix="s3-upload"
+        )
+    image_executor: Optional[ProcessPoolExecutor] = None
+    if convert_webp:
+        image_executor = ProcessPoolExecutor()
 
-            try:
-                metadata = fetch_camera_metadata(session, api_key)
-            except requests.HTTPError as exc:
-                LOGGER.error("HTTP error from LTA API: %s", exc, exc_info=True)
-                metadata = []
-            except requests.RequestException as exc:
-                LOGGER.error("Network error when contacting LTA API: %s", exc, exc_info=True)
-                metadata = []
-            except Exception:  # pragma: no cover - unexpected errors logged for visibility
-                LOGGER.exception("Unexpected error when fetching camera metadata")
-                metadata = []
-
-            found_cameras = set()
-            timestamp = datetime.now(timezone.utc)
-            for entry in metadata:
-                camera_id = str(entry.get("CameraID"))
-                if camera_id not in camera_lookup:
-                    continue
-                image_link = entry.get("ImageLink")
-                if not isinstance(image_link, str) or not image_link:
-                    LOGGER.warning("No image link available for camera %s", camera_id)
-                    continue
+    async def run_cycle(client: httpx.AsyncClient) -> None:
+        """Fetch the metadata once and download every matching camera image."""
 
-                camera = camera_lookup[camera_id]
-                try:
-                    destination = download_image(session, camera, image_link, output_dir, timestamp)
-                    LOGGER.info("Downloaded camera %s image to %s", camera_id, destination)
-                    found_cameras.add(camera_id)
-                    if upload_callback is not None:
-                        upload_callback(destination, camera)
-                except requests.HTTPError as exc:
-                    LOGGER.warning("Failed to download image for camera %s: %s", camera_id, exc)
-                except requests.RequestException as exc:
-                    LOGGER.warning(
-                        "Network error when downloading image for camera %s: %s", camera_id, exc
-                    )
+        try:
+            metadata = await fetch_camera_metadata(client, metadata_headers, metadata_cache)
+        except httpx.HTTPStatusError as exc:
+            LOGGER.error("HTTP error from LTA API: %s", exc, exc_info=True)
+            metadata = []
+        except httpx.HTTPError as exc:
+            LOGGER.error("Network error when contacting LTA API: %s", exc, exc_info=True)
+            metadata = []
+        except Exception:  # pragma: no cover - unexpected errors logged for visibility
+            LOGGER.exception("Unexpected error when fetching camera metadata")
+            metadata = []
+
+        timestamp = datetime.now(timezone.utc)
+        # Restrict to the cameras from the CSV up front so the task-building
+        # loop only touches relevant entries.
+        entries = [
+            (camera_id, entry)
+            for entry in metadata
+            if (camera_id := str(entry.get("CameraID"))) in wanted_cameras
+        ]
+        tasks = []
+        for camera_id, entry in entries:
+            image_link = entry.get("ImageLink")
+            if not isinstance(image_link, str) or not image_link:
+                LOGGER.warning("No image link available for camera %s", camera_id)
+                continue
 
-            missing = set(camera_lookup) - found_cameras
-            if missing:
-                LOGGER.warning(
-                    "Did not receive data for %d cameras in this cycle: %s", len(missing), ", ".join(sorted(missing))
+            tasks.append(
+                _download_for_camera(
+                    client,
+                    camera_lookup[camera_id],
+                    image_link,
+                    output_dir,
+                    timestamp,
+                    semaphore,
+                    last_digests,
+                    last_modified,
+                    image_executor,
+                    upload_callback,
+                    upload_executor,
                 )
+            )
+
+        results = await asyncio.gather(*tasks)
+        found_cameras = {camera_id for camera_id in results if camera_id is not None}
+
+        missing = set(camera_lookup) - found_cameras
+        if missing:
+            LOGGER.warning(
+                "Did not receive data for %d cameras in this cycle: %s", len(missing), ", ".join(sorted(missing))
+            )
+
+    try:
+        async with httpx.AsyncClient(transport=transport, timeout=timeout) as client:
+            # Tick N is scheduled at start + N * interval, so per-cycle timing
+            # jitter does not accumulate over a week-long run.
+            next_deadline = time.monotonic()
+            while True:
+                cycle_start = time.monotonic()
+                if cycle_start >= end_monotonic:
+                    LOGGER.info("Reached end of requested duration; stopping fetch loop")
+                    break
 
-            # Sleep until the next scheduled interval, taking into account the time spent so far.
-            elapsed = datetime.now(timezone.utc) - loop_start
-            sleep_seconds = interval.total_seconds() - elapsed.total_seconds()
-            if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
+                seconds_since_midnight = int(time.time() + tz_offset_seconds) % SECONDS_PER_DAY
+                if not within_active_window(seconds_since_midnight, active_start_seconds, active_end_seconds):
+                    wait_seconds = seconds_until_window(seconds_since_midnight, active_start_seconds, active_end_seconds)
+                    if wait_seconds <= 0:
+                        continue
+                    remaining = end_monotonic - cycle_start
+                    if remaining <= 0:
+                        LOGGER.info("Reached end of requested duration while waiting for active window")
+                        break
+                    sleep_seconds = min(wait_seconds, remaining)
+                    LOGGER.debug(
+                        "Local second-of-day %d outside active window; sleeping %.0f seconds until next window",
+                        seconds_since_midnight,
+                        sleep_seconds,
+                    )
+                    await asyncio.sleep(max(0, sleep_seconds))
+                    continue
+
+                await run_cycle(client)
+
+                # Sleep until the next absolute deadline rather than for a
+                # relative delta, so measurement error never shifts the phase.
+                now = time.monotonic()
+                next_deadline += interval_seconds
+                if next_deadline <= now:
+                    # Fell behind by one interval or more (long cycle or an
+                    # overnight window wait); skip the missed ticks instead of
+                    # firing a catch-up burst.
+                    missed = math.ceil((now - next_deadline) / interval_seconds)
+                    next_deadline += missed * interval_seconds
+                await asyncio.sleep(max(0, next_deadline - now))
+    finally:
+        if image_executor is not None:
+            image_executor.shutdown(wait=True)
+        if upload_executor is not None:
+            upload_executor.shutdown(wait=True)
 
 
 def positive_float(value: str) -> float:
@@ -326,6 +638,16 @@ def positive_float(value: str) -> float:
     return result
 
 
+def positive_int(value: str) -> int:
+    try:
+        result = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+    if result <= 0:
+        raise argparse.ArgumentTypeError("Value must be positive")
+    return result
+
+
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -367,6 +689,17 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
         default=os.environ.get("LTA_API_KEY"),
         help="LTA API key. Defaults to the LTA_API_KEY environment variable.",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=positive_int,
+        default=DEFAULT_DOWNLOAD_CONCURRENCY,
+        help="Maximum number of images downloaded in parallel per cycle (default: 16)",
+    )
+    parser.add_argument(
+        "--convert-webp",
+        action="store_true",
+        help="Re-encode downloaded images as WebP (requires Pillow).",
+    )
     parser.add_argument(
         "--s3-bucket",
         help="If provided, upload images to the specified AWS S3 bucket.",
@@ -423,6 +756,13 @@ def main(argv: Sequence[str] | None = None) -> int:
         LOGGER.error("Active window start and end times cannot be identical")
         return 1
 
+    if args.convert_webp:
+        try:  # Fail early instead of inside the worker processes.
+            import PIL  # noqa: F401
+        except ImportError:
+            LOGGER.error("Pillow must be installed to convert images to WebP")
+            return 1
+
     uploader = None
     if args.s3_bucket:
         try:
@@ -443,16 +783,20 @@ def main(argv: Sequence[str] | None = None) -> int:
         return 1
 
     try:
-        poll_and_download(
-            cameras=cameras,
-            api_key=args.api_key,
-            output_dir=args.output_dir,
-            interval=timedelta(minutes=args.interval_minutes),
-            duration=timedelta(days=args.duration_days),
-            active_start_seconds=active_start_seconds,
-            active_end_seconds=active_end_seconds,
-            active_timezone=SINGAPORE_TZ,
-            upload_callback=uploader.upload if uploader else None,
+        asyncio.run(
+            poll_and_download(
+                cameras=cameras,
+                api_key=args.api_key,
+                output_dir=args.output_dir,
+                interval=timedelta(minutes=args.interval_minutes),
+                duration=timedelta(days=args.duration_days),
+                active_start_seconds=active_start_seconds,
+                active_end_seconds=active_end_seconds,
+                active_timezone=SINGAPORE_TZ,
+                upload_callback=uploader.upload if uploader else None,
+                convert_webp=args.convert_webp,
+                max_concurrency=args.max_concurrency,
+            )
         )
     except KeyboardInterrupt:
         LOGGER.info("Interrupted by user; exiting")